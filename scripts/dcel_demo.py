@@ -3,11 +3,11 @@ from pytopmod.core.dcel import obj_io, primitives
 
 def main():
     with open("dcel_triangle.obj", "w", encoding="utf-8") as f:
-        f.write(obj_io.mesh_to_obj(primitives.triangle()))
+        obj_io.write_obj(primitives.triangle(), f)
 
     mesh = primitives.tetrahedron()
     with open("dcel_tetrahedron.obj", "w", encoding="utf-8") as f:
-        f.write(obj_io.mesh_to_obj(mesh))
+        obj_io.write_obj(mesh, f)
 
 
 if __name__ == "__main__":
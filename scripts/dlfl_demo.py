@@ -4,11 +4,11 @@ from pytopmod.core.dlfl.operations import subdivision
 
 def main():
     with open("dlfl_triangle.obj", "w", encoding="utf-8") as f:
-        f.write(obj_io.mesh_to_obj(primitives.triangle()))
+        obj_io.write_obj(primitives.triangle(), f)
 
     mesh = primitives.tetrahedron()
     with open("dlfl_tetrahedron.obj", "w", encoding="utf-8") as f:
-        f.write(obj_io.mesh_to_obj(mesh))
+        obj_io.write_obj(mesh, f)
 
     print("Subdividing tetrahedron...")
     for _ in range(10):
@@ -16,7 +16,7 @@ def main():
             subdivision.triangulate_face(mesh, face_key)
     print(f"Done. Faces={len(mesh.face_keys):_}, Vertices={len(mesh.vertex_keys):_}")
     with open("dlfl_tetrahedron_subdivided.obj", "w", encoding="utf-8") as f:
-        f.write(obj_io.mesh_to_obj(mesh))
+        obj_io.write_obj(mesh, f)
 
 
 if __name__ == "__main__":
@@ -1,15 +1,16 @@
 """Helper functions for operations on circular lists."""
-from typing import Generator, Tuple, TypeVar
+from typing import Iterator, Tuple, TypeVar
 
 T = TypeVar("T")
 
 
-def pairs(list_: list[T]) -> Generator[Tuple[T, T], None, None]:
-    """Returns a generator over item pairs in a circular list.
+def pairs(list_: list[T]) -> Iterator[Tuple[T, T]]:
+    """Returns an iterator over item pairs in a circular list.
 
     E.g: pairs([1, 2, 3]) => (1, 2), (2, 3), (3, 1).
     """
-    return ((item, list_[(index + 1) % len(list_)]) for index, item in enumerate(list_))
+    # Zip the list with a copy of itself rotated by one item.
+    return zip(list_, list_[1:] + list_[:1])
 
 
 def circulated_to(list_: list[T], index: int) -> list[T]:
@@ -17,7 +18,8 @@ def circulated_to(list_: list[T], index: int) -> list[T]:
 
     E.g: circulated_to([1,2,3,4], 1) => [3, 4, 1, 2].
     """
-    return list_[(index + 1) % len(list_) :] + list_[: (index + 1) % len(list_)]
+    split_index = (index + 1) % len(list_)
+    return list_[split_index:] + list_[:split_index]
 
 
 def circulated_to_item(list_: list[T], item: T) -> list[T]:
@@ -33,7 +35,7 @@ def circulated_to_pair(list_: list[T], pair: Tuple[T, T]) -> list[T]:
 
     E.g: circulated_to_pair([1, 2, 3, 4, 3, 2], (4, 3)) => [2, 1, 2, 3, 4, 3].
     """
-    return circulated_to(list_, list(pairs(list_)).index(pair) + 1)
+    return circulated_to(list_, pair_index(list_, pair) + 1)
 
 
 def split_at(list_: list[T], index: int) -> Tuple[list[T], list[T]]:
@@ -41,7 +43,8 @@ def split_at(list_: list[T], index: int) -> Tuple[list[T], list[T]]:
 
     E.g: split_at([1, 2, 3, 4], 2) => ([1, 2], [3, 4]).
     """
-    return (list_[: index % len(list_)], list_[index % len(list_) :])
+    split_index = index % len(list_)
+    return (list_[:split_index], list_[split_index:])
 
 
 def split_at_item(list_: list[T], item: T) -> Tuple[list[T], list[T]]:
@@ -52,19 +55,80 @@ def split_at_item(list_: list[T], item: T) -> Tuple[list[T], list[T]]:
     return split_at(list_, list_.index(item) + 1)
 
 
+def circulated_split_at_item(
+    list_: list[T], last_item: T, split_item: T
+) -> Tuple[list[T], list[T]]:
+    """Returns a list circulated so 'last_item' is last, split at 'split_item'.
+
+    Equivalent to split_at_item(circulated_to_item(list_, last_item), split_item),
+    without building the circulated list.
+
+    E.g: circulated_split_at_item([1, 2, 3, 4], 2, 4) => ([3, 4], [1, 2]).
+    """
+    # The circulated list starts right after last_item.
+    start = list_.index(last_item) + 1
+    try:
+        split_index = list_.index(split_item, start)
+    except ValueError:
+        split_index = list_.index(split_item, 0, start)
+        if split_index == start - 1:
+            # split_item is last_item itself, i.e the last circulated item.
+            return ([], list_[start:] + list_[:start])
+        return (
+            list_[start:] + list_[: split_index + 1],
+            list_[split_index + 1 : start],
+        )
+    return (list_[start : split_index + 1], list_[split_index + 1 :] + list_[:start])
+
+
 def split_at_pair(list_: list[T], pair: Tuple[T, T]) -> Tuple[list[T], list[T]]:
     """Returns the two slices of a list split at 'pair'.
 
     E.g: split_at_pair([1, 2, 3, 4, 3, 2], (3, 4)) => ([1, 2, 3, 4], [3, 2]).
     """
-    return split_at(list_, list(pairs(list_)).index(pair) + 2)
+    return split_at(list_, pair_index(list_, pair) + 2)
+
+
+def contains_pair(list_: list[T], pair: Tuple[T, T]) -> bool:
+    """Returns whether 'pair' is a pair of consecutive items in a circular list.
+
+    Equivalent to pair in pairs(list_), without building the pairs.
+    """
+    return _find_pair(list_, pair) >= 0
+
+
+def pair_index(list_: list[T], pair: Tuple[T, T]) -> int:
+    """Returns the index of the first item of 'pair' in a circular list.
+
+    Equivalent to list(pairs(list_)).index(pair), without building the pairs.
+    """
+    index = _find_pair(list_, pair)
+    if index < 0:
+        raise ValueError(f"{pair} is not in list")
+    return index
+
+
+def _find_pair(list_: list[T], pair: Tuple[T, T]) -> int:
+    """Returns the index of the first item of 'pair' in a circular list, or -1."""
+    item_1, item_2 = pair
+    last_index = len(list_) - 1
+    # Only check the successors of the occurrences of item_1, which list.index
+    # finds without iterating over the list in Python.
+    index = -1
+    for _ in range(list_.count(item_1)):
+        index = list_.index(item_1, index + 1)
+        if list_[index + 1 if index < last_index else 0] == item_2:
+            return index
+    return -1
 
 
 def next_item(list_: list[T], item: T) -> T:
     """Returns the item after 'item' in the passed list."""
-    return list_[(list_.index(item) + 1) % len(list_)]
+    next_index = list_.index(item) + 1
+    return list_[next_index] if next_index < len(list_) else list_[0]
 
 
 def previous_item(list_: list[T], item: T) -> T:
     """Returns the item before 'item' in the passed list."""
-    return list_[(list_.index(item) - 1) % len(list_)]
+    # A negative index wraps around to the end of the list.
+    return list_[list_.index(item) - 1]
@@ -1,10 +1,11 @@
 import dataclasses
-from typing import Generator
+from typing import Iterator
 
 from pytopmod.core import keystore
 from pytopmod.core import mesh as base_mesh
 from pytopmod.core.edge import EdgeKey
 from pytopmod.core.face import FaceKey
+from pytopmod.core.geometry import Point3D
 from pytopmod.core.vertex import VertexKey
 
 
@@ -20,7 +21,15 @@ class EdgeNode:
     next_edge_2_key: EdgeKey
 
     def __repr__(self) -> str:
-        return dataclasses.astuple(self).__repr__()
+        # Not using dataclasses.astuple, which deep-copies every field.
+        return (
+            self.vertex_1_key,
+            self.vertex_2_key,
+            self.face_1_key,
+            self.face_2_key,
+            self.next_edge_1_key,
+            self.next_edge_2_key,
+        ).__repr__()
 
 
 @dataclasses.dataclass(slots=True)
@@ -29,16 +38,47 @@ class Mesh(base_mesh.Mesh):
 
     This structure uses a map of EdgeNodes.
 
+    Two indices are maintained alongside it so incident edges can be found
+    without scanning all the edge nodes:
+     - vertex_to_edges: A map that associates each vertex with the edges it is an
+        endpoint of.
+     - face_to_edges: A map that associates each face with the edges on its
+        boundary.
+
     Manifold-preserving operators are implemented in 'operators.py'.
     """
 
     edge_keys: keystore.KeyStore[EdgeKey] = dataclasses.field(init=False)
     edge_nodes: dict[EdgeKey, EdgeNode] = dataclasses.field(init=False)
+    vertex_to_edges: dict[VertexKey, dict[EdgeKey, None]] = dataclasses.field(
+        init=False
+    )
+    face_to_edges: dict[FaceKey, dict[EdgeKey, None]] = dataclasses.field(init=False)
 
     def __post_init__(self):
         super(Mesh, self).__post_init__()
         self.edge_keys = keystore.KeyStore[EdgeKey]("e")
         self.edge_nodes = {}
+        self.vertex_to_edges = {}
+        self.face_to_edges = {}
+
+    def create_vertex(self, position: Point3D) -> VertexKey:
+        vertex_key = base_mesh.Mesh.create_vertex(self, position)
+        self.vertex_to_edges[vertex_key] = {}
+        return vertex_key
+
+    def delete_vertex(self, vertex_key: VertexKey):
+        base_mesh.Mesh.delete_vertex(self, vertex_key)
+        del self.vertex_to_edges[vertex_key]
+
+    def create_face(self) -> FaceKey:
+        face_key = base_mesh.Mesh.create_face(self)
+        self.face_to_edges[face_key] = {}
+        return face_key
+
+    def delete_face(self, face_key: FaceKey):
+        base_mesh.Mesh.delete_face(self, face_key)
+        del self.face_to_edges[face_key]
 
     def create_edge(
         self,
@@ -58,20 +98,49 @@ class Mesh(base_mesh.Mesh):
             next_edge_1_key,
             next_edge_2_key,
         )
+        self.vertex_to_edges[vertex_1_key][edge_key] = None
+        self.vertex_to_edges[vertex_2_key][edge_key] = None
+        self.face_to_edges[face_1_key][edge_key] = None
+        self.face_to_edges[face_2_key][edge_key] = None
         return edge_key
 
     def delete_edge(self, edge_key: EdgeKey):
-        del self.edge_nodes[edge_key]
+        edge_node = self.edge_nodes.pop(edge_key)
+        # Endpoints (resp. faces) may coincide, hence the default values.
+        self.vertex_to_edges[edge_node.vertex_1_key].pop(edge_key, None)
+        self.vertex_to_edges[edge_node.vertex_2_key].pop(edge_key, None)
+        self.face_to_edges[edge_node.face_1_key].pop(edge_key, None)
+        self.face_to_edges[edge_node.face_2_key].pop(edge_key, None)
         return self.edge_keys.delete(edge_key)
 
-    def vertex_edges(self, vertex_key: VertexKey) -> Generator[EdgeKey, None, None]:
-        """Returns a generator over the edges incident to a vertex."""
-        for edge_key, node in self.edge_nodes.items():
-            if vertex_key in (node.vertex_1_key, node.vertex_2_key):
-                yield edge_key
-
-    def face_edges(self, face: FaceKey) -> Generator[EdgeKey, None, None]:
-        """Returns a generator over the edges on the boundary of a face."""
-        for edge_key, node in self.edge_nodes.items():
-            if face in (node.face_1_key, node.face_2_key):
-                yield edge_key
+    def set_edge_face(
+        self, edge_key: EdgeKey, vertex_key: VertexKey, face_key: FaceKey
+    ):
+        """Sets the face on one side of an edge node and updates the face index.
+
+        The side is the one of the corner at the passed vertex (face_1 for vertex_1,
+        face_2 for vertex_2), so an edge with the same face on both sides can be
+        updated one side at a time.
+        """
+        edge_node = self.edge_nodes[edge_key]
+        if vertex_key == edge_node.vertex_1_key:
+            old_face_key = edge_node.face_1_key
+            other_face_key = edge_node.face_2_key
+            edge_node.face_1_key = face_key
+        else:
+            old_face_key = edge_node.face_2_key
+            other_face_key = edge_node.face_1_key
+            edge_node.face_2_key = face_key
+
+        # The edge stays on the old face's boundary through its other side.
+        if old_face_key != other_face_key:
+            del self.face_to_edges[old_face_key][edge_key]
+        self.face_to_edges[face_key][edge_key] = None
+
+    def vertex_edges(self, vertex_key: VertexKey) -> Iterator[EdgeKey]:
+        """Returns an iterator over the edges incident to a vertex."""
+        return iter(self.vertex_to_edges[vertex_key])
+
+    def face_edges(self, face: FaceKey) -> Iterator[EdgeKey]:
+        """Returns an iterator over the edges on the boundary of a face."""
+        return iter(self.face_to_edges[face])
@@ -1,7 +1,7 @@
 """Manifold-preserving operators on DCEL Meshes."""
-from typing import Generator, Optional
+from typing import Generator, Optional, Tuple
 
-from pytopmod.core import circular_list, corner
+from pytopmod.core import corner
 from pytopmod.core.dcel import mesh as dcel_mesh
 from pytopmod.core.edge import EdgeKey
 from pytopmod.core.face import FaceKey
@@ -14,39 +14,69 @@ def corner_from_edge_vertex(
     """Returns the corner defined by an edge and a vertex."""
     edge_node = mesh.edge_nodes[edge_key]
 
-    if vertex_key not in (edge_node.vertex_1_key, edge_node.vertex_2_key):
-        raise ValueError(f"Vertex {vertex_key} is not an endpoint of edge {edge_key}.")
+    if vertex_key == edge_node.vertex_1_key:
+        return corner.Corner(
+            vertex_key=vertex_key,
+            face_key=edge_node.face_1_key,
+            edge_1_key=edge_key,
+            edge_2_key=edge_node.next_edge_1_key,
+        )
+    if vertex_key == edge_node.vertex_2_key:
+        return corner.Corner(
+            vertex_key=vertex_key,
+            face_key=edge_node.face_2_key,
+            edge_1_key=edge_key,
+            edge_2_key=edge_node.next_edge_2_key,
+        )
 
-    return corner.Corner(
-        vertex_key=vertex_key,
-        face_key=(
-            edge_node.face_1_key
-            if vertex_key == edge_node.vertex_1_key
-            else edge_node.face_2_key
-        ),
-        edge_1_key=edge_key,
-        edge_2_key=(
-            edge_node.next_edge_1_key
-            if vertex_key == edge_node.vertex_1_key
-            else edge_node.next_edge_2_key
-        ),
-    )
+    raise ValueError(f"Vertex {vertex_key} is not an endpoint of edge {edge_key}.")
 
 
 def corner_from_face_vertex(
     mesh: dcel_mesh.Mesh, face_key: FaceKey, vertex_key: VertexKey
 ) -> corner.Corner:
     """Returns the corner defined by a face and a vertex."""
+    # The corner is the one formed at the passed vertex by the edge of its rotation
+    # that has the passed face on the vertex's side (face_1 for vertex_1, face_2
+    # for vertex_2).
     for edge_key in vertex_trace(mesh, vertex_key):
         edge_node = mesh.edge_nodes[edge_key]
-        if edge_node.face_1_key == face_key:
-            return corner_from_edge_vertex(mesh, edge_key, edge_node.vertex_1_key)
-        if edge_node.face_2_key == face_key:
-            return corner_from_edge_vertex(mesh, edge_key, edge_node.vertex_2_key)
+        if vertex_key == edge_node.vertex_1_key:
+            if edge_node.face_1_key == face_key:
+                return corner.Corner(
+                    vertex_key=vertex_key,
+                    face_key=face_key,
+                    edge_1_key=edge_key,
+                    edge_2_key=edge_node.next_edge_1_key,
+                )
+        elif edge_node.face_2_key == face_key:
+            return corner.Corner(
+                vertex_key=vertex_key,
+                face_key=face_key,
+                edge_1_key=edge_key,
+                edge_2_key=edge_node.next_edge_2_key,
+            )
 
     raise ValueError(f"Vertex {vertex_key} is not in face {face_key}.")
 
 
+def _next_edge_at_vertex(
+    mesh: dcel_mesh.Mesh, edge_key: EdgeKey, vertex_key: VertexKey
+) -> EdgeKey:
+    """Returns the edge after an edge in the rotation of one of its endpoints.
+
+    This is the edge_2 of the corner defined by the edge and the vertex.
+    """
+    edge_node = mesh.edge_nodes[edge_key]
+
+    if vertex_key == edge_node.vertex_1_key:
+        return edge_node.next_edge_1_key
+    if vertex_key == edge_node.vertex_2_key:
+        return edge_node.next_edge_2_key
+
+    raise ValueError(f"Vertex {vertex_key} is not an endpoint of edge {edge_key}.")
+
+
 def vertex_trace(
     mesh: dcel_mesh.Mesh,
     vertex_key: VertexKey,
@@ -56,16 +86,15 @@ def vertex_trace(
 
     The starting edge can optionally be specified, otherwise one will be picked.
     """
-    start_corner = corner_from_edge_vertex(
-        mesh, start_edge_key or next(mesh.vertex_edges(vertex_key)), vertex_key
-    )
-    yield start_corner.edge_1_key
-
-    corner = corner_from_edge_vertex(mesh, start_corner.edge_2_key, vertex_key)
+    # Walk the edge nodes directly rather than building a Corner per step: each
+    # corner's edge_2 is the next edge of the rotation.
+    start_edge_key = start_edge_key or next(mesh.vertex_edges(vertex_key))
+    edge_key = _next_edge_at_vertex(mesh, start_edge_key, vertex_key)
+    yield start_edge_key
 
-    while corner != start_corner:
-        yield corner.edge_1_key
-        corner = corner_from_edge_vertex(mesh, corner.edge_2_key, vertex_key)
+    while edge_key != start_edge_key:
+        yield edge_key
+        edge_key = _next_edge_at_vertex(mesh, edge_key, vertex_key)
 
 
 def face_trace(
@@ -75,24 +104,85 @@ def face_trace(
 
     The starting edge can optionally be specified, otherwise one will be picked.
     """
-    start_edge_key = start_edge_key or next(mesh.face_edges(face_key))
-    yield start_edge_key
+    for edge_key, _ in _face_corners(mesh, face_key, start_edge_key):
+        yield edge_key
 
-    edge_node = mesh.edge_nodes[start_edge_key]
-    edge_key = (
-        edge_node.next_edge_1_key
-        if edge_node.face_1_key == face_key
-        else edge_node.next_edge_2_key
-    )
 
-    while edge_key != start_edge_key:
-        yield edge_key
+def face_trace_with_vertices(
+    mesh: dcel_mesh.Mesh, face_key: FaceKey, start_edge_key: Optional[EdgeKey] = None
+) -> Generator[Tuple[EdgeKey, VertexKey], None, None]:
+    """Returns a generator over the edges that form a face boundary.
+
+    Each edge is yielded along with the vertex it starts from when following the
+    boundary, i.e. the vertex it shares with the previous edge.
+    """
+    for edge_key, vertex_key in _face_corners(mesh, face_key, start_edge_key):
         edge_node = mesh.edge_nodes[edge_key]
-        edge_key = (
-            edge_node.next_edge_1_key
+        # The edge ends at its corner's vertex, so it starts from the other one.
+        yield (
+            edge_key,
+            (
+                edge_node.vertex_2_key
+                if vertex_key == edge_node.vertex_1_key
+                else edge_node.vertex_1_key
+            ),
+        )
+
+
+def _face_corners(
+    mesh: dcel_mesh.Mesh,
+    face_key: FaceKey,
+    start_edge_key: Optional[EdgeKey] = None,
+    start_vertex_key: Optional[VertexKey] = None,
+) -> Generator[Tuple[EdgeKey, VertexKey], None, None]:
+    """Returns a generator over the corners of a face boundary.
+
+    Each corner is yielded as its (edge_1, vertex) pair, edge_2 being the next edge
+    in the vertex's rotation, and the boundary continues at the next edge's other
+    endpoint. The edge nodes' faces are not read along the way, so the walk stays
+    on one side of edges that have the face on both sides.
+
+    The starting corner can optionally be specified, otherwise the starting edge's
+    side is the one with the passed face (face_1 if both sides have it).
+    """
+    edge_nodes = mesh.edge_nodes
+
+    start_edge_key = start_edge_key or next(mesh.face_edges(face_key))
+    if start_vertex_key is None:
+        edge_node = edge_nodes[start_edge_key]
+        start_vertex_key = (
+            edge_node.vertex_1_key
             if edge_node.face_1_key == face_key
-            else edge_node.next_edge_2_key
+            else edge_node.vertex_2_key
+        )
+
+    edge_key, vertex_key = start_edge_key, start_vertex_key
+    while True:
+        yield (edge_key, vertex_key)
+        edge_key = _next_edge_at_vertex(mesh, edge_key, vertex_key)
+        edge_node = edge_nodes[edge_key]
+        vertex_key = (
+            edge_node.vertex_2_key
+            if vertex_key == edge_node.vertex_1_key
+            else edge_node.vertex_1_key
         )
+        if edge_key == start_edge_key and vertex_key == start_vertex_key:
+            return
+
+
+def previous_in_vertex_trace(
+    mesh: dcel_mesh.Mesh, vertex_key: VertexKey, edge_key: EdgeKey
+) -> EdgeKey:
+    """Returns the edge before 'edge_key' in the rotation of a vertex.
+
+    Equivalent to circular_list.previous_item(list(vertex_trace(...)), edge_key),
+    without building the rotation list.
+    """
+    # Starting the trace from the passed edge, its predecessor is the last edge.
+    previous_edge_key = edge_key
+    for previous_edge_key in vertex_trace(mesh, vertex_key, edge_key):
+        pass
+    return previous_edge_key
 
 
 def _update_next_edge(
@@ -104,15 +194,14 @@ def _update_next_edge(
     """Updates the next edge information of an edge node at the passed vertex."""
     edge_node = mesh.edge_nodes[edge_key]
 
-    if at_vertex_key not in (edge_node.vertex_1_key, edge_node.vertex_2_key):
-        raise ValueError(
-            f"Vertex {at_vertex_key} is not an endpoint of edge {edge_key}."
-        )
-
     if at_vertex_key == edge_node.vertex_1_key:
         edge_node.next_edge_1_key = new_edge_key
-    if at_vertex_key == edge_node.vertex_2_key:
+    elif at_vertex_key == edge_node.vertex_2_key:
         edge_node.next_edge_2_key = new_edge_key
+    else:
+        raise ValueError(
+            f"Vertex {at_vertex_key} is not an endpoint of edge {edge_key}."
+        )
 
 
 def _replace_face(
@@ -120,14 +209,17 @@ def _replace_face(
     old_face_key: FaceKey,
     new_face_key: FaceKey,
     start_edge_key: Optional[EdgeKey] = None,
+    start_vertex_key: Optional[VertexKey] = None,
 ):
-    """Replaces a face by another one in a mesh."""
-    for edge_key in list(face_trace(mesh, old_face_key, start_edge_key)):
-        edge_node = mesh.edge_nodes[edge_key]
-        if edge_node.face_1_key == old_face_key:
-            edge_node.face_1_key = new_face_key
-        if edge_node.face_2_key == old_face_key:
-            edge_node.face_2_key = new_face_key
+    """Replaces a face by another one in a mesh.
+
+    Only the sides of the edges along the walked boundary are updated: the old face
+    may still label another boundary, e.g while a face is being split.
+    """
+    for edge_key, vertex_key in _face_corners(
+        mesh, old_face_key, start_edge_key, start_vertex_key
+    ):
+        mesh.set_edge_face(edge_key, vertex_key, new_face_key)
 
 
 def insert_edge(
@@ -146,131 +238,206 @@ def insert_edge(
     corner_1 = corner_from_edge_vertex(mesh, edge_1_key, vertex_1_key)
     corner_2 = corner_from_edge_vertex(mesh, edge_2_key, vertex_2_key)
 
+    if corner_1.face_key == corner_2.face_key:
+        _insert_edge_cofacial(mesh, corner_1, corner_2)
+    else:
+        _insert_edge_non_cofacial(mesh, corner_1, corner_2)
+
+
+def _insert_edge_cofacial(
+    mesh: dcel_mesh.Mesh, corner_1: corner.Corner, corner_2: corner.Corner
+):
+    """Inserts an edge between two corners of the same face.
+
+    This will split the old face into two new ones.
+    """
+    vertex_1_key = corner_1.vertex_key
+    vertex_2_key = corner_2.vertex_key
+    face_key = corner_1.face_key
+
     # Set the vertex and edge information for the new edge.
     # 2 - Create a new edge node.
     new_edge_key = mesh.create_edge(
         vertex_1_key,
         vertex_2_key,
-        corner_1.face_key,
-        corner_2.face_key,
+        face_key,
+        face_key,
         corner_1.edge_2_key,
         corner_2.edge_2_key,
     )
-    new_edge_node = mesh.edge_nodes[new_edge_key]
 
-    # Non-cofacial insertion.
-    if corner_1.face_key != corner_2.face_key:
-        # 3.1 - Update the face information.
+    # 4.1 - Update the edge information.
+    _update_next_edge(mesh, corner_1.edge_1_key, vertex_1_key, new_edge_key)
+    _update_next_edge(mesh, corner_2.edge_1_key, vertex_2_key, new_edge_key)
 
-        # Create a new face.
-        new_face_key = mesh.create_face()
+    # 4.2 - Update the face information.
+    # Create two new faces.
+    new_face_1_key = mesh.create_face()
+    new_face_2_key = mesh.create_face()
 
-        # Traverse the corners' faces and replace face_1 and face_2 by the new face.
-        _replace_face(mesh, corner_1.face_key, new_face_key)
-        _replace_face(mesh, corner_2.face_key, new_face_key)
+    # Starting from the new edge's corner at vertex_1, replace face_1 by
+    # new_face_1.
+    _replace_face(mesh, face_key, new_face_1_key, new_edge_key, vertex_1_key)
+    # Starting from its corner at vertex_2, replace face_1 by new_face_2.
+    _replace_face(mesh, face_key, new_face_2_key, new_edge_key, vertex_2_key)
 
-        # Set the face information for the new edge.
-        new_edge_node.face_1_key = new_face_key
-        new_edge_node.face_2_key = new_face_key
+    # Delete face_1 == face_2.
+    mesh.delete_face(face_key)
 
-        # Delete the old faces.
-        mesh.delete_face(corner_1.face_key)
-        mesh.delete_face(corner_2.face_key)
 
-        # 3.2 - Update the edge information.
-        _update_next_edge(mesh, corner_1.edge_1_key, corner_1.vertex_key, new_edge_key)
-        _update_next_edge(mesh, corner_2.edge_1_key, corner_2.vertex_key, new_edge_key)
+def _insert_edge_non_cofacial(
+    mesh: dcel_mesh.Mesh, corner_1: corner.Corner, corner_2: corner.Corner
+):
+    """Inserts an edge between two corners of two different faces.
 
-    # Cofacial insertion.
-    else:
-        face_key = corner_1.face_key
+    This will merge the two old faces into a new one.
+    """
+    vertex_1_key = corner_1.vertex_key
+    vertex_2_key = corner_2.vertex_key
+    face_1_key = corner_1.face_key
+    face_2_key = corner_2.face_key
 
-        # 4.1 - Update the edge information.
-        _update_next_edge(mesh, corner_1.edge_1_key, corner_1.vertex_key, new_edge_key)
-        _update_next_edge(mesh, corner_2.edge_1_key, corner_2.vertex_key, new_edge_key)
+    # Set the vertex and edge information for the new edge.
+    # 2 - Create a new edge node.
+    new_edge_key = mesh.create_edge(
+        vertex_1_key,
+        vertex_2_key,
+        face_1_key,
+        face_2_key,
+        corner_1.edge_2_key,
+        corner_2.edge_2_key,
+    )
+
+    # 3.1 - Update the face information.
 
-        # 4.2 - Update the face information.
-        # Create two new faces.
-        new_face_1_key = mesh.create_face()
-        new_face_2_key = mesh.create_face()
+    # Create a new face.
+    new_face_key = mesh.create_face()
 
-        # Starting from one direction of the new edge, replace face_1 by new_face_1.
-        _replace_face(mesh, face_key, new_face_1_key, corner_1.edge_2_key)
-        # Starting from the opposite direction, replace face_1 by new_face_2.
-        _replace_face(mesh, face_key, new_face_2_key, corner_2.edge_2_key)
+    # Traverse the corners' faces and replace face_1 and face_2 by the new face.
+    _replace_face(mesh, face_1_key, new_face_key)
+    _replace_face(mesh, face_2_key, new_face_key)
 
-        # Delete face_1 == face_2.
-        mesh.delete_face(face_key)
+    # Set the face information for the new edge.
+    mesh.set_edge_face(new_edge_key, vertex_1_key, new_face_key)
+    mesh.set_edge_face(new_edge_key, vertex_2_key, new_face_key)
+
+    # Delete the old faces.
+    mesh.delete_face(face_1_key)
+    mesh.delete_face(face_2_key)
+
+    # 3.2 - Update the edge information.
+    _update_next_edge(mesh, corner_1.edge_1_key, vertex_1_key, new_edge_key)
+    _update_next_edge(mesh, corner_2.edge_1_key, vertex_2_key, new_edge_key)
 
 
 def delete_edge(mesh: dcel_mesh.Mesh, old_edge: EdgeKey):
+    """Deletes an edge.
+
+    If the two sides of the edge:
+      - belong to the same face, the face will be split into two new ones.
+      - belong to two different faces, the faces will be merged into a new one.
+    """
     old_edge_node = mesh.edge_nodes[old_edge]
 
     corner_1 = corner_from_edge_vertex(mesh, old_edge, old_edge_node.vertex_1_key)
     corner_2 = corner_from_edge_vertex(mesh, old_edge, old_edge_node.vertex_2_key)
 
+    if corner_1.face_key == corner_2.face_key:
+        _delete_edge_cofacial(mesh, old_edge, corner_1, corner_2)
+    else:
+        _delete_edge_non_cofacial(mesh, old_edge, corner_1, corner_2)
+
+
+def _delete_edge_cofacial(
+    mesh: dcel_mesh.Mesh,
+    old_edge: EdgeKey,
+    corner_1: corner.Corner,
+    corner_2: corner.Corner,
+):
+    """Deletes an edge with the same face on both sides.
+
+    This will split the old face into two new ones.
+    """
+    vertex_1_key = corner_1.vertex_key
+    vertex_2_key = corner_2.vertex_key
+    face_key = corner_1.face_key
+
     # 1.1 - Find the edge before the old edge in the rotation of vertex_1.
-    vertex_1_previous_edge_key = circular_list.previous_item(
-        list(vertex_trace(mesh, corner_1.vertex_key)), old_edge
-    )
+    vertex_1_previous_edge_key = previous_in_vertex_trace(mesh, vertex_1_key, old_edge)
 
     # 1.2 - Find the edge before the old edge in the rotation of vertex_2.
-    vertex_2_previous_edge_key = circular_list.previous_item(
-        list(vertex_trace(mesh, corner_2.vertex_key)), old_edge
+    vertex_2_previous_edge_key = previous_in_vertex_trace(mesh, vertex_2_key, old_edge)
+
+    # 3.1 - Update the edge information to delete the edge.
+    _update_next_edge(
+        mesh, vertex_1_previous_edge_key, vertex_1_key, corner_1.edge_2_key
+    )
+    _update_next_edge(
+        mesh, vertex_2_previous_edge_key, vertex_2_key, corner_2.edge_2_key
     )
 
-    # 2 - Non-cofacial deletion.
-    if corner_1.face_key != corner_2.face_key:
-        # 2.1 - Update the face information.
-        # Create a new face.
-        new_face_key = mesh.create_face()
+    # Delete the edge.
+    mesh.delete_edge(old_edge)
 
-        # Traverse face_1 and face_2, replace face_1 and face_2 with new_face.
-        _replace_face(mesh, corner_1.face_key, new_face_key)
-        _replace_face(mesh, corner_2.face_key, new_face_key)
+    # 3.2 - Update the face information.
+    # Create two new faces.
+    new_face_1_key = mesh.create_face()
+    new_face_2_key = mesh.create_face()
 
-        # Delete face_1 and face_2.
-        mesh.delete_face(corner_1.face_key)
-        mesh.delete_face(corner_2.face_key)
+    # Starting from vertex_1_previous' corner at vertex_1, traverse the face and
+    # replace face_1 by new_face_1.
+    _replace_face(
+        mesh, face_key, new_face_1_key, vertex_1_previous_edge_key, vertex_1_key
+    )
 
-        # 2.2 - Update the edge information to delete the edge.
-        _update_next_edge(
-            mesh, vertex_1_previous_edge_key, corner_1.vertex_key, corner_1.edge_2_key
-        )
-        _update_next_edge(
-            mesh, vertex_2_previous_edge_key, corner_2.vertex_key, corner_2.edge_2_key
-        )
+    # Starting from vertex_2_previous' corner at vertex_2, traverse the face and
+    # replace face_1 by new_face_2.
+    _replace_face(
+        mesh, face_key, new_face_2_key, vertex_2_previous_edge_key, vertex_2_key
+    )
 
-        # Delete the edge.
-        mesh.delete_edge(old_edge)
+    # Delete face_1 == face_2.
+    mesh.delete_face(face_key)
 
-    # 3 - Cofacial deletion.
-    else:
-        face_key = corner_1.face_key
 
-        # 3.1 - Update the edge information to delete the edge.
-        _update_next_edge(
-            mesh, vertex_1_previous_edge_key, corner_1.vertex_key, corner_1.edge_2_key
-        )
-        _update_next_edge(
-            mesh, vertex_2_previous_edge_key, corner_2.vertex_key, corner_2.edge_2_key
-        )
+def _delete_edge_non_cofacial(
+    mesh: dcel_mesh.Mesh,
+    old_edge: EdgeKey,
+    corner_1: corner.Corner,
+    corner_2: corner.Corner,
+):
+    """Deletes an edge between two different faces.
 
-        # Delete the edge.
-        mesh.delete_edge(old_edge)
+    This will merge the two old faces into a new one.
+    """
+    vertex_1_key = corner_1.vertex_key
+    vertex_2_key = corner_2.vertex_key
+    face_1_key = corner_1.face_key
+    face_2_key = corner_2.face_key
 
-        # 3.2 - Update the face information.
-        # Create two new faces.
-        new_face_1_key = mesh.create_face()
-        new_face_2_key = mesh.create_face()
+    # 1.1 - Find the edge before the old edge in the rotation of vertex_1.
+    vertex_1_previous_edge_key = previous_in_vertex_trace(mesh, vertex_1_key, old_edge)
+
+    # 1.2 - Find the edge before the old edge in the rotation of vertex_2.
+    vertex_2_previous_edge_key = previous_in_vertex_trace(mesh, vertex_2_key, old_edge)
 
-        # Starting from vertex_1_previous, traverse the face and replace face_1 by
-        # new_face_1.
-        _replace_face(mesh, face_key, new_face_1_key, vertex_1_previous_edge_key)
+    # 2.1 - Update the face information.
+    # Create a new face.
+    new_face_key = mesh.create_face()
 
-        # Starting from vertex_2_previous, traverse the face and replace face_1 by
-        # new_face_2.
-        _replace_face(mesh, face_key, new_face_2_key, vertex_2_previous_edge_key)
+    # Traverse face_1 and face_2, replace face_1 and face_2 with new_face.
+    _replace_face(mesh, face_1_key, new_face_key)
+    _replace_face(mesh, face_2_key, new_face_key)
+
+    # 2.2 - Update the edge information to delete the edge.
+    _update_next_edge(
+        mesh, vertex_1_previous_edge_key, vertex_1_key, corner_1.edge_2_key
+    )
+    _update_next_edge(
+        mesh, vertex_2_previous_edge_key, vertex_2_key, corner_2.edge_2_key
+    )
 
-        # Delete face_1 == face_2.
-        mesh.delete_face(face_key)
+    # Delete the edge and the old faces.
+    mesh.delete_edge(old_edge)
+    mesh.delete_face(face_1_key)
+    mesh.delete_face(face_2_key)
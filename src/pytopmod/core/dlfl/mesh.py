@@ -1,4 +1,5 @@
 import dataclasses
+from typing import Iterable
 
 from pytopmod.core import mesh as base_mesh
 from pytopmod.core.face import FaceKey
@@ -13,8 +14,8 @@ class Mesh(base_mesh.Mesh):
     This structure uses two maps:
      - face_vertices: A map that associates each face with an ordered list of the
         vertices forming its boundary.
-     - vertex_faces: A map that associates each vertex with an (unordered) set of
-        faces in its rotation.
+     - vertex_faces: A map that associates each vertex with the faces in its
+        rotation, not in rotation order.
 
     Manifold-preserving operators are implemented in 'operators.py'.
     """
@@ -22,24 +23,44 @@ class Mesh(base_mesh.Mesh):
     face_vertices: dict[FaceKey, list[VertexKey]] = dataclasses.field(
         default_factory=dict
     )
-    vertex_faces: dict[VertexKey, set[FaceKey]] = dataclasses.field(
+    vertex_faces: dict[VertexKey, dict[FaceKey, None]] = dataclasses.field(
         default_factory=dict
     )
 
+    # The overrides below call the base class methods directly instead of going
+    # through a super() proxy, as every operator creates and deletes faces.
     def create_vertex(self, position: Point3D) -> VertexKey:
-        vertex_key = super(Mesh, self).create_vertex(position)
-        self.vertex_faces[vertex_key] = set()
+        vertex_key = base_mesh.Mesh.create_vertex(self, position)
+        self.vertex_faces[vertex_key] = {}
         return vertex_key
 
     def delete_vertex(self, vertex_key: VertexKey):
-        super(Mesh, self).delete_vertex(vertex_key)
+        base_mesh.Mesh.delete_vertex(self, vertex_key)
         del self.vertex_faces[vertex_key]
 
     def create_face(self) -> FaceKey:
-        face_key = super(Mesh, self).create_face()
+        face_key = base_mesh.Mesh.create_face(self)
         self.face_vertices[face_key] = []
         return face_key
 
     def delete_face(self, face_key: FaceKey):
-        super(Mesh, self).delete_face(face_key)
+        base_mesh.Mesh.delete_face(self, face_key)
         del self.face_vertices[face_key]
+
+    def create_faces(self, boundaries: Iterable[Iterable[VertexKey]]) -> list[FaceKey]:
+        """Creates faces from their boundaries, given as ordered lists of vertices.
+
+        The face boundaries being the whole DLFL topology, this builds a mesh in a
+        single pass instead of one face boundary walk per inserted edge. The
+        boundaries are stored as is: it is up to the caller to pass a manifold set
+        of faces.
+        """
+        face_keys = []
+        for boundary in boundaries:
+            face_key = base_mesh.Mesh.create_face(self)
+            face_vertices = list(boundary)
+            self.face_vertices[face_key] = face_vertices
+            for vertex_key in face_vertices:
+                self.vertex_faces[vertex_key][face_key] = None
+            face_keys.append(face_key)
+        return face_keys
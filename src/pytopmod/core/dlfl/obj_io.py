@@ -1,28 +1,78 @@
 """Conversion functions between OBJ format and DLFL representation."""
+import io
+from typing import TextIO
+
+from pytopmod.core import obj_io as base_obj_io
 from pytopmod.core.dlfl import mesh as dlfl_mesh
 from pytopmod.core.vertex import VertexKey
 
 
 def mesh_to_obj(mesh: dlfl_mesh.Mesh) -> str:
     """Converts a dlfl_mesh.Mesh to OBJ format."""
-    vertex_index_map: dict[VertexKey, int] = {}
+    buffer = io.StringIO()
+    write_obj(mesh, buffer)
+    return buffer.getvalue()
+
 
-    obj_vertices: list[str] = []
-    for index, vertex_key in enumerate(mesh.vertex_keys):
-        vertex_index_map[vertex_key] = index
-        coordinates = (str(coord) for coord in mesh.vertex_coordinates[vertex_key])
-        obj_vertices.append(f'v {" ".join(coordinates)}')
+def write_obj(mesh: dlfl_mesh.Mesh, file: TextIO):
+    """Writes a dlfl_mesh.Mesh to a text file in OBJ format."""
+    vertex_indices = base_obj_io.write_vertices(mesh, file)
 
-    obj_faces: list[str] = []
+    separator = ""
     for face_key in mesh.face_keys:
-        indices = (
-            str(vertex_index_map[vertex_key] + 1)
-            for vertex_key in mesh.face_vertices[face_key]
+        file.write(separator)
+        file.write("f ")
+        file.write(
+            " ".join(map(vertex_indices.__getitem__, mesh.face_vertices[face_key]))
         )
-        obj_faces.append(f'f {" ".join(indices)}')
-
-    return "\n".join(obj_vertices) + "\n" + "\n".join(obj_faces)
+        separator = "\n"
 
 
 def obj_to_mesh(obj: str) -> dlfl_mesh.Mesh:
-    raise NotImplementedError()
+    """Converts an OBJ format string to a dlfl_mesh.Mesh.
+
+    Only vertex ('v') and face ('f') statements are read, other statements (e.g
+    normals, texture coordinates, groups) are ignored.
+
+    The file is read in a single pass over its lines, each line being split into
+    tokens once. Since the face boundaries are the whole DLFL topology, they are
+    stored directly rather than built up through edge insertions.
+
+    Raises:
+        ValueError: If a vertex has fewer than three coordinates, or if a face
+            references a vertex index that is 0 or does not match a vertex read so
+            far.
+    """
+    mesh = dlfl_mesh.Mesh()
+    vertex_keys: list[VertexKey] = []
+    faces: list[list[VertexKey]] = []
+
+    for line in obj.splitlines():
+        tokens = line.split()
+        if not tokens:
+            continue
+        if tokens[0] == "v":
+            if len(tokens) < 4:
+                raise ValueError(f"Missing vertex coordinates: {line!r}.")
+            vertex_keys.append(
+                mesh.create_vertex(
+                    (float(tokens[1]), float(tokens[2]), float(tokens[3]))
+                )
+            )
+        elif tokens[0] == "f":
+            # Face elements may be of the form 'v/vt/vn'. Vertex indices are
+            # 1-based, or negative to count back from the last vertex read so far.
+            face_vertex_keys: list[VertexKey] = []
+            for token in tokens[1:]:
+                index = int(token.partition("/")[0])
+                resolved_index = index - 1 if index > 0 else len(vertex_keys) + index
+                if index == 0 or not 0 <= resolved_index < len(vertex_keys):
+                    raise ValueError(
+                        f"Invalid vertex index {index} in face statement: {line!r}."
+                    )
+                face_vertex_keys.append(vertex_keys[resolved_index])
+            faces.append(face_vertex_keys)
+
+    mesh.create_faces(faces)
+
+    return mesh
@@ -1,11 +1,10 @@
 """Subdivision operations for DLFL Meshes."""
-from typing import Tuple, cast
+from typing import Tuple
 
 from pytopmod.core import geometry
 from pytopmod.core.dlfl import mesh as dlfl_mesh
 from pytopmod.core.dlfl import operators
 from pytopmod.core.face import FaceKey
-from pytopmod.core.geometry import Point3D
 from pytopmod.core.vertex import VertexKey
 
 
@@ -18,40 +17,31 @@ def subdivide_edge(
 ) -> Tuple[VertexKey, Tuple[FaceKey, FaceKey]]:
     """Subdivides an edge at its midpoint.
 
-    Returns the vertex created at the midpoint and the new faces.
-    """
-    # Delete the old edge.
-    deletion_face_keys = operators.delete_edge(
-        mesh, vertex_1_key, face_1_key, vertex_2_key, face_2_key
-    )
+    The faces may be passed whichever way around the edge goes through them (see
+    operators.split_edge). They are kept as is rather than replaced with new ones.
 
-    # Create a point-sphere at the old edge's midpoint.
-    new_vertex_key, new_face_key = operators.create_point_sphere(
-        mesh,
-        cast(
-            Point3D,
-            geometry.midpoint(
-                mesh.vertex_coordinates[vertex_1_key],
-                mesh.vertex_coordinates[vertex_2_key],
-            ),
-        ),
-    )
+    Returns the vertex created at the midpoint and the faces on both sides of the
+    subdivided edge, i.e (face_1_key, face_2_key).
 
-    # Insert an edge from the first vertex to the midpoint.
-    insertion_1_face_keys = operators.insert_edge(
-        mesh, vertex_1_key, deletion_face_keys[0], new_vertex_key, new_face_key
-    )
-
-    # Insert an edge from the midpoint to the second vertex.
-    insertion_2_face_keys = operators.insert_edge(
+    Raises:
+        ValueError: If the vertices do not form an edge between the faces.
+    """
+    # Splice a vertex at the edge's midpoint into the faces' boundaries. This is
+    # equivalent to deleting the edge, creating a point-sphere at its midpoint and
+    # inserting edges from both vertices to it, without the intermediate faces.
+    new_vertex_key = operators.split_edge(
         mesh,
-        new_vertex_key,
-        insertion_1_face_keys[0],
+        vertex_1_key,
+        face_1_key,
         vertex_2_key,
-        insertion_1_face_keys[1],
+        face_2_key,
+        geometry.midpoint(
+            mesh.vertex_coordinates[vertex_1_key],
+            mesh.vertex_coordinates[vertex_2_key],
+        ),
     )
 
-    return (new_vertex_key, insertion_2_face_keys)
+    return (new_vertex_key, (face_1_key, face_2_key))
 
 
 def triangulate_face(
@@ -67,11 +57,8 @@ def triangulate_face(
     # Create a point sphere at the centroid of the face.
     centroid_vertex, centroid_face = operators.create_point_sphere(
         mesh,
-        cast(
-            Tuple[float, float, float],
-            geometry.centroid(
-                mesh.vertex_coordinates[vertex_key] for vertex_key in face_vertex_keys
-            ),
+        geometry.centroid(
+            mesh.vertex_coordinates[vertex_key] for vertex_key in face_vertex_keys
         ),
     )
 
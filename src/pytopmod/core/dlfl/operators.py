@@ -24,60 +24,48 @@ def vertex_trace(
     mesh: dlfl_mesh.Mesh, vertex_key: VertexKey
 ) -> Generator[HalfEdge, None, None]:
     """Returns a generator over the half-edges of a vertex rotation."""
-    # Pick a first face in the set of the vertex's faces rotation.
-    first_face_key = next(iter(mesh.vertex_faces[vertex_key]))
-    # Output the first half-edge formed by the passed vertex and its successor
-    # in the picked face's boundary: [u, v].
-    first_half_edge = HalfEdge(
-        (
-            vertex_key,
-            circular_list.next_item(mesh.face_vertices[first_face_key], vertex_key),
-        ),
-        first_face_key,
-    )
-    yield first_half_edge
-
-    # Find the face in the vertex rotation that contains the opposite
-    # half-edge.
-    face_key = next(
-        key
-        for key in mesh.vertex_faces[first_half_edge.vertex_keys[1]]
-        if (first_half_edge.vertex_keys[1], first_half_edge.vertex_keys[0])
-        in circular_list.pairs(mesh.face_vertices[key])
-    )
-
-    half_edge = HalfEdge(
-        (first_half_edge.vertex_keys[1], first_half_edge.vertex_keys[0]), face_key
-    )
-
-    while half_edge != first_half_edge:
-        yield half_edge
-        if half_edge.vertex_keys[1] == vertex_key:
-            # If the current half-edge's tail vertex is the passed vertex, form the
-            # next half-edge from the passed vertex and its successor in the current
+    face_vertices = mesh.face_vertices
+    vertex_faces = mesh.vertex_faces
+
+    # Pick a first face in the vertex's faces rotation, and start from the
+    # half-edge formed by the passed vertex and its successor in the picked face's
+    # boundary: [u, v].
+    rotation = vertex_faces[vertex_key]
+    first_face_key = next(iter(rotation))
+    first_head_key = circular_list.next_item(face_vertices[first_face_key], vertex_key)
+    yield HalfEdge((vertex_key, first_head_key), first_face_key)
+
+    # The current half-edge is kept as its (tail, head) vertices and face.
+    tail_key, head_key, face_key = vertex_key, first_head_key, first_face_key
+    while True:
+        if head_key == vertex_key:
+            # If the current half-edge's head is the passed vertex, form the next
+            # half-edge from the passed vertex and its successor in the current
             # face.
-            half_edge = HalfEdge(
-                (
-                    half_edge.vertex_keys[1],
-                    circular_list.next_item(
-                        mesh.face_vertices[face_key], half_edge.vertex_keys[1]
-                    ),
-                ),
-                face_key,
-            )
+            tail_key = vertex_key
+            head_key = circular_list.next_item(face_vertices[face_key], vertex_key)
         else:
-            # If the current half-edge's head is the passed vertex, find the face in
-            # the passed vertex rotation that contains the opposite half-edge.
+            # Otherwise, find the face that contains the opposite half-edge. As it
+            # ends at the passed vertex, that face is in both the head vertex's
+            # rotation and the passed vertex's: scan the smaller of the two.
+            tail_key, head_key = head_key, tail_key
+            face_keys = vertex_faces[tail_key]
+            if len(rotation) < len(face_keys):
+                face_keys = rotation
             face_key = next(
                 key
-                for key in mesh.vertex_faces[half_edge.vertex_keys[1]]
-                if (half_edge.vertex_keys[1], half_edge.vertex_keys[0])
-                in circular_list.pairs(mesh.face_vertices[key])
-            )
-            half_edge = HalfEdge(
-                (half_edge.vertex_keys[1], half_edge.vertex_keys[0]), face_key
+                for key in face_keys
+                if circular_list.contains_pair(face_vertices[key], (tail_key, head_key))
             )
 
+        if (
+            tail_key == vertex_key
+            and head_key == first_head_key
+            and face_key == first_face_key
+        ):
+            return
+        yield HalfEdge((tail_key, head_key), face_key)
+
 
 def create_point_sphere(
     mesh: dlfl_mesh.Mesh, position: Point3D
@@ -91,10 +79,66 @@ def create_point_sphere(
     vertex_key = mesh.create_vertex(position)
     face_key = mesh.create_face()
     mesh.face_vertices[face_key].append(vertex_key)
-    mesh.vertex_faces[vertex_key].add(face_key)
+    mesh.vertex_faces[vertex_key][face_key] = None
     return (vertex_key, face_key)
 
 
+def split_edge(
+    mesh: dlfl_mesh.Mesh,
+    vertex_1_key: VertexKey,
+    face_1_key: FaceKey,
+    vertex_2_key: VertexKey,
+    face_2_key: FaceKey,
+    position: Point3D,
+) -> VertexKey:
+    """Splits an edge by creating a vertex on it.
+
+    The edge goes from vertex_1 to vertex_2 in one of the faces' boundaries, and
+    from vertex_2 to vertex_1 in the other's, whichever way around the faces are
+    passed. The created vertex is inserted between them in both boundaries, so no
+    face is created or deleted.
+
+    Returns the created vertex.
+
+    Raises:
+        ValueError: If the vertices do not form an edge between the faces.
+    """
+    face_1_vertices = mesh.face_vertices[face_1_key]
+    face_2_vertices = mesh.face_vertices[face_2_key]
+
+    # Orient the edge as it goes around face_1, face_2 holding the opposite
+    # half-edge.
+    tail_key, head_key = vertex_1_key, vertex_2_key
+    if not circular_list.contains_pair(face_1_vertices, (tail_key, head_key)):
+        tail_key, head_key = head_key, tail_key
+    if not (
+        circular_list.contains_pair(face_1_vertices, (tail_key, head_key))
+        and circular_list.contains_pair(face_2_vertices, (head_key, tail_key))
+    ):
+        raise ValueError(
+            f"Vertices {vertex_1_key} and {vertex_2_key} do not form an edge between"
+            f" faces {face_1_key} and {face_2_key}."
+        )
+
+    vertex_key = mesh.create_vertex(position)
+
+    # Both faces may be the same, so face_2's insertion index is only looked up
+    # once face_1's boundary is updated.
+    face_1_vertices.insert(
+        circular_list.pair_index(face_1_vertices, (tail_key, head_key)) + 1,
+        vertex_key,
+    )
+    face_2_vertices.insert(
+        circular_list.pair_index(face_2_vertices, (head_key, tail_key)) + 1,
+        vertex_key,
+    )
+
+    mesh.vertex_faces[vertex_key][face_1_key] = None
+    mesh.vertex_faces[vertex_key][face_2_key] = None
+
+    return vertex_key
+
+
 def insert_edge(
     mesh: dlfl_mesh.Mesh,
     vertex_1_key: VertexKey,
@@ -108,9 +152,13 @@ def insert_edge(
      - A tuple of (new_face_1_key, new_face_2_key) for a cofacial insertion.
      - A tuple of (new_face_key, new_face_key) for a non-cofacial insertion.
     """
-    return (
-        _insert_edge_cofacial if face_1_key == face_2_key else _insert_edge_non_cofacial
-    )(mesh, vertex_1_key, face_1_key, vertex_2_key, face_2_key)
+    if face_1_key == face_2_key:
+        return _insert_edge_cofacial(
+            mesh, vertex_1_key, face_1_key, vertex_2_key, face_2_key
+        )
+    return _insert_edge_non_cofacial(
+        mesh, vertex_1_key, face_1_key, vertex_2_key, face_2_key
+    )
 
 
 def _insert_edge_cofacial(
@@ -124,33 +172,34 @@ def _insert_edge_cofacial(
 
     This will split the old face into two new ones.
     """
+    face_vertices = mesh.face_vertices
+    vertex_faces = mesh.vertex_faces
+
     # Create two new faces.
     new_face_1_key = mesh.create_face()
     new_face_2_key = mesh.create_face()
 
     # Compute the boundaries of the newly created faces as the boundary of the old
     # face circulated to end with vertex_2 and split at vertex_1.
-    new_face_1_vertices, new_face_2_vertices = circular_list.split_at_item(
-        circular_list.circulated_to_item(
-            mesh.face_vertices[old_face_key], vertex_2_key
-        ),
-        vertex_1_key,
+    new_face_1_vertices, new_face_2_vertices = circular_list.circulated_split_at_item(
+        face_vertices[old_face_key], vertex_2_key, vertex_1_key
     )
 
     # Append vertex_2 to new_face_1's boundary (resp. vertex_1 to new_face_2).
-    mesh.face_vertices[new_face_1_key] = new_face_1_vertices + [vertex_2_key]
-    mesh.face_vertices[new_face_2_key] = new_face_2_vertices + [vertex_1_key]
+    # Both boundaries are fresh slices, so they are extended in place.
+    new_face_1_vertices.append(vertex_2_key)
+    new_face_2_vertices.append(vertex_1_key)
+    face_vertices[new_face_1_key] = new_face_1_vertices
+    face_vertices[new_face_2_key] = new_face_2_vertices
 
     # Update the vertices face rotations:
     # Replace old_face with new_face_1 for each vertex in new_face_1.
-    for vertex_key in mesh.face_vertices[new_face_1_key]:
-        mesh.vertex_faces[vertex_key].discard(old_face_key)
-        mesh.vertex_faces[vertex_key].add(new_face_1_key)
+    for vertex_key in new_face_1_vertices:
+        _replace_in_rotation(vertex_faces[vertex_key], old_face_key, new_face_1_key)
 
     # Replace old_face with new_face_2 for each vertex in new_face_2.
-    for vertex_key in mesh.face_vertices[new_face_2_key]:
-        mesh.vertex_faces[vertex_key].discard(old_face_key)
-        mesh.vertex_faces[vertex_key].add(new_face_2_key)
+    for vertex_key in new_face_2_vertices:
+        _replace_in_rotation(vertex_faces[vertex_key], old_face_key, new_face_2_key)
 
     # Delete the old face.
     mesh.delete_face(old_face_key)
@@ -169,34 +218,40 @@ def _insert_edge_non_cofacial(
 
     This will merge the two old faces into a new one.
     """
+    face_vertices = mesh.face_vertices
+    vertex_faces = mesh.vertex_faces
+
     # Create a new face.
     new_face_key = mesh.create_face()
 
-    old_face_1_vertices = mesh.face_vertices[old_face_1]
-    old_face_2_vertices = mesh.face_vertices[old_face_2]
+    old_face_1_vertices = face_vertices[old_face_1]
+    old_face_2_vertices = face_vertices[old_face_2]
 
     # Compute the boundary of the newly created face as the concatenation of:
     #  - old_face_1's boundary circulated to end with vertex_1
     #  - old_face_2's boundary circulated to end with vertex_2's predecessor.
     #  - vertex_2 if old face 2 was not a point-sphere.
     #  - vertex_2 if old_face_1 was not a point-sphere.
-    new_face_vertex_keys = (
-        circular_list.circulated_to_item(old_face_1_vertices, vertex_1_key)
-        + circular_list.circulated_to_item(
-            old_face_2_vertices,
-            circular_list.previous_item(old_face_2_vertices, vertex_2_key),
-        )
-        + ([vertex_2_key] if len(old_face_2_vertices) > 1 else [])
-        + ([vertex_1_key] if len(old_face_1_vertices) > 1 else [])
+    new_face_vertex_keys = circular_list.circulated_to_item(
+        old_face_1_vertices, vertex_1_key
     )
-    mesh.face_vertices[new_face_key] = new_face_vertex_keys
-
-    # Update the vertices face rotations:
-    for vertex_key in new_face_vertex_keys:
-        # Replace old_face_1 and old_face_2 with the new_face for each vertex.
-        mesh.vertex_faces[vertex_key].discard(old_face_1)
-        mesh.vertex_faces[vertex_key].discard(old_face_2)
-        mesh.vertex_faces[vertex_key].add(new_face_key)
+    new_face_vertex_keys += circular_list.circulated_to_item(
+        old_face_2_vertices,
+        circular_list.previous_item(old_face_2_vertices, vertex_2_key),
+    )
+    if len(old_face_2_vertices) > 1:
+        new_face_vertex_keys.append(vertex_2_key)
+    if len(old_face_1_vertices) > 1:
+        new_face_vertex_keys.append(vertex_1_key)
+    face_vertices[new_face_key] = new_face_vertex_keys
+
+    # Update the vertices face rotations: the new face's vertices are those of the
+    # old faces, so replace old_face_1 (resp. old_face_2) with the new face for each
+    # vertex of old_face_1 (resp. old_face_2).
+    for vertex_key in old_face_1_vertices:
+        _replace_in_rotation(vertex_faces[vertex_key], old_face_1, new_face_key)
+    for vertex_key in old_face_2_vertices:
+        _replace_in_rotation(vertex_faces[vertex_key], old_face_2, new_face_key)
 
     # Delete the old faces.
     mesh.delete_face(old_face_1)
@@ -218,9 +273,13 @@ def delete_edge(
      - A tuple of (new_face_1_key, new_face_2_key) for a cofacial deletion.
      - A tuple of (new_face_key, new_face_key) for a non-cofacial deletion.
     """
-    return (
-        _delete_edge_cofacial if face_1_key == face_2_key else _delete_edge_non_cofacial
-    )(mesh, vertex_1_key, face_1_key, vertex_2_key, face_2_key)
+    if face_1_key == face_2_key:
+        return _delete_edge_cofacial(
+            mesh, vertex_1_key, face_1_key, vertex_2_key, face_2_key
+        )
+    return _delete_edge_non_cofacial(
+        mesh, vertex_1_key, face_1_key, vertex_2_key, face_2_key
+    )
 
 
 def _delete_edge_cofacial(
@@ -234,6 +293,9 @@ def _delete_edge_cofacial(
 
     This will split the old face into two new ones.
     """
+    face_vertices = mesh.face_vertices
+    vertex_faces = mesh.vertex_faces
+
     # Create two new faces.
     new_face_1_key = mesh.create_face()
     new_face_2_key = mesh.create_face()
@@ -242,26 +304,26 @@ def _delete_edge_cofacial(
     # circulated to (vertex_1, vertex_2) and split at (vertex_2, vertex_1).
     new_face_1_vertices, new_face_2_vertices = circular_list.split_at_pair(
         circular_list.circulated_to_pair(
-            mesh.face_vertices[old_face_key], (vertex_1_key, vertex_2_key)
+            face_vertices[old_face_key], (vertex_1_key, vertex_2_key)
         ),
         (vertex_2_key, vertex_1_key),
     )
 
     # Remove the last vertices from the created faces (i.e vertex_1 and
-    # vertex_2).
-    mesh.face_vertices[new_face_1_key] = new_face_1_vertices[:-1]
-    mesh.face_vertices[new_face_2_key] = new_face_2_vertices[:-1]
+    # vertex_2), in place as both are fresh slices.
+    new_face_1_vertices.pop()
+    new_face_2_vertices.pop()
+    face_vertices[new_face_1_key] = new_face_1_vertices
+    face_vertices[new_face_2_key] = new_face_2_vertices
 
     # Update the vertices face rotations:
-    for vertex_key in mesh.face_vertices[new_face_1_key]:
+    for vertex_key in new_face_1_vertices:
         # Replace old_face with new_face_1 for each vertex in new_face_1.
-        mesh.vertex_faces[vertex_key].discard(old_face_key)
-        mesh.vertex_faces[vertex_key].add(new_face_1_key)
+        _replace_in_rotation(vertex_faces[vertex_key], old_face_key, new_face_1_key)
 
-    for vertex_key in mesh.face_vertices[new_face_2_key]:
+    for vertex_key in new_face_2_vertices:
         # Replace old_face with new_face_2 for each vertex in new_face_2.
-        mesh.vertex_faces[vertex_key].discard(old_face_key)
-        mesh.vertex_faces[vertex_key].add(new_face_2_key)
+        _replace_in_rotation(vertex_faces[vertex_key], old_face_key, new_face_2_key)
 
     # Delete the old face.
     mesh.delete_face(old_face_key)
@@ -280,31 +342,50 @@ def _delete_edge_non_cofacial(
 
     This will merge the two old faces into a new one.
     """
+    face_vertices = mesh.face_vertices
+    vertex_faces = mesh.vertex_faces
+
     # Create a new face.
     new_face_key = mesh.create_face()
 
-    old_face_1_vertices = mesh.face_vertices[old_face_1]
-    old_face_2_vertices = mesh.face_vertices[old_face_2]
+    old_face_1_vertices = face_vertices[old_face_1]
+    old_face_2_vertices = face_vertices[old_face_2]
 
     # Compute the new face's boundary as the concatenation of:
     #  - old_face_1's boundary circulated to vertex_1, without vertex_1.
     #  - old_face_2's boundary circulated to vertex_2, without vertex_2.
-    new_face_vertex_keys = (
-        circular_list.circulated_to_item(old_face_1_vertices, vertex_1_key)[:-1]
-        + circular_list.circulated_to_item(old_face_2_vertices, vertex_2_key)[:-1]
+    new_face_vertex_keys = circular_list.circulated_to_item(
+        old_face_1_vertices, vertex_1_key
     )
+    new_face_vertex_keys.pop()
+    new_face_vertex_keys += circular_list.circulated_to_item(
+        old_face_2_vertices, vertex_2_key
+    )
+    new_face_vertex_keys.pop()
 
-    mesh.face_vertices[new_face_key] = new_face_vertex_keys
+    face_vertices[new_face_key] = new_face_vertex_keys
 
-    # Update the vertices face rotations:
-    for vertex_key in new_face_vertex_keys:
-        # Replace old_face_1 and old_face_2 with new_face for each vertex of the
-        # new face.
-        mesh.vertex_faces[vertex_key].discard(old_face_1)
-        mesh.vertex_faces[vertex_key].discard(old_face_2)
-        mesh.vertex_faces[vertex_key].add(new_face_key)
+    # Update the vertices face rotations: vertex_1 and vertex_2 are still on the
+    # new face's boundary through the other old face, so no vertex is left out by
+    # replacing each old face with the new face for the vertices of that face.
+    for vertex_key in old_face_1_vertices:
+        _replace_in_rotation(vertex_faces[vertex_key], old_face_1, new_face_key)
+    for vertex_key in old_face_2_vertices:
+        _replace_in_rotation(vertex_faces[vertex_key], old_face_2, new_face_key)
 
     mesh.delete_face(old_face_1)
     mesh.delete_face(old_face_2)
 
     return (new_face_key, new_face_key)
+
+
+def _replace_in_rotation(
+    face_keys: dict[FaceKey, None], old_face_key: FaceKey, new_face_key: FaceKey
+):
+    """Replaces a face with another one in a vertex's face rotation.
+
+    A vertex may appear several times in a face boundary, in which case the old
+    face may have already been replaced, hence the default value.
+    """
+    face_keys.pop(old_face_key, None)
+    face_keys[new_face_key] = None
@@ -1,4 +1,4 @@
-from typing import Iterable, Tuple, TypeAlias, cast
+from typing import Iterable, Tuple, TypeAlias
 
 Point: TypeAlias = Tuple[float, ...]
 
@@ -6,16 +6,22 @@ Point: TypeAlias = Tuple[float, ...]
 Point3D: TypeAlias = Tuple[float, float, float]
 
 
-def midpoint(point_1: Point, point_2: Point) -> Point:
+def midpoint(point_1: Point3D, point_2: Point3D) -> Point3D:
     """Returns the midpoint between two points."""
-    return tuple(sum(pair) / 2.0 for pair in zip(point_1, point_2))
+    x_1, y_1, z_1 = point_1
+    x_2, y_2, z_2 = point_2
+    return ((x_1 + x_2) / 2.0, (y_1 + y_2) / 2.0, (z_1 + z_2) / 2.0)
 
 
-def centroid(points: Iterable[Point]) -> Point:
+def centroid(points: Iterable[Point3D]) -> Point3D:
     """Returns the centroid of a set of points."""
-    sum_coords: Tuple[float, ...] = (0.0, 0.0, 0.0)
+    # Accumulate each coordinate separately rather than building a tuple of sums
+    # for every point.
+    sum_x = sum_y = sum_z = 0.0
     num = 0.0
-    for point in points:
-        sum_coords = tuple(cast(float, sum(pair)) for pair in zip(sum_coords, point))
+    for x, y, z in points:
+        sum_x += x
+        sum_y += y
+        sum_z += z
         num += 1.0
-    return tuple(coord / num for coord in sum_coords)
+    return (sum_x / num, sum_y / num, sum_z / num)
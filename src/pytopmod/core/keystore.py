@@ -1,4 +1,5 @@
 import collections
+import sys
 from typing import Generic, Iterator, TypeVar, cast
 
 K = TypeVar("K", bound=str)
@@ -19,34 +20,48 @@ class KeyStore(Generic[K]):
 
     Internally, the keys are maintained in a collections.Counter which remembers
     the order in which items were added for testing reproductibility (vs. a set).
+
+    Keys are interned, so that dict lookups with equal keys (e.g a generated key
+    and a literal one in a primitive) resolve with an identity check rather than
+    a string comparison.
     """
 
+    __slots__ = ("_key_prefix", "_key_index_offset", "_counter", "_count")
+
     def __init__(self, key_prefix: str, key_index_offset: int = 1):
         self._key_prefix = key_prefix
         self._key_index_offset = key_index_offset
         self._counter = collections.Counter[K]()
+        # Running total of the counter, maintained by new() and delete().
+        self._count = 0
 
     def __iter__(self) -> Iterator[K]:
         return self._counter.elements()
 
     def __contains__(self, key: K) -> bool:
-        return self._counter[key] > 0
+        return self._counter.get(key, 0) > 0
 
     def __repr__(self) -> str:
         return list(self.__iter__()).__repr__()
 
     def __len__(self) -> int:
-        return self._counter.total()
+        return self._count
 
     def new(self) -> K:
         key = cast(
-            K, f"{self._key_prefix}{len(self._counter) + self._key_index_offset}"
+            K,
+            sys.intern(
+                f"{self._key_prefix}{len(self._counter) + self._key_index_offset}"
+            ),
         )
-        self._counter.update([key])
+        # Generated keys are never reused, so this is the key's first count.
+        self._counter[key] = 1
+        self._count += 1
         return key
 
     def delete(self, key: K):
-        self._counter.subtract([key])
+        self._counter[key] -= 1
+        self._count -= 1
 
     def contains(self, key: K) -> bool:
         return self.__contains__(key)
@@ -12,6 +12,9 @@ class Mesh:
 
     Stores and provides create/delete methods for vertice and face keys.
     Also exposes a vertex coordinates map.
+
+    Subclasses store sets of keys as dicts with None values: these are
+    insertion-ordered, which keeps traversals reproducible (vs. a set).
     """
 
     vertex_keys: KeyStore[VertexKey] = dataclasses.field(init=False)
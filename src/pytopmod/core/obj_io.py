@@ -0,0 +1,23 @@
+"""OBJ format helpers shared by the Mesh representations."""
+from typing import TextIO
+
+from pytopmod.core import mesh as base_mesh
+from pytopmod.core.vertex import VertexKey
+
+
+def write_vertices(mesh: base_mesh.Mesh, file: TextIO) -> dict[VertexKey, str]:
+    """Writes the vertex ('v') lines of a Mesh to a text file in OBJ format.
+
+    Returns a map of each vertex to its formatted OBJ (1-based) index, for the face
+    lines to reuse.
+    """
+    vertex_indices: dict[VertexKey, str] = {}
+
+    # Coordinates keep their shortest round-tripping representation, as with str().
+    format_vertex = "v {} {} {}\n".format
+
+    for index, vertex_key in enumerate(mesh.vertex_keys):
+        vertex_indices[vertex_key] = str(index + 1)
+        file.write(format_vertex(*mesh.vertex_coordinates[vertex_key]))
+
+    return vertex_indices
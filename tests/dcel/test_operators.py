@@ -0,0 +1,84 @@
+"""Tests for the manifold-preserving operators on DCEL Meshes."""
+import unittest
+
+from pytopmod.core import corner
+from pytopmod.core.dcel import mesh as dcel_mesh
+from pytopmod.core.dcel import operators, primitives
+
+
+class OperatorsTestCase(unittest.TestCase):
+    def assertConsistent(self, mesh: dcel_mesh.Mesh):
+        """Asserts that the edge nodes' faces match the faces and their index."""
+        self.assertEqual(set(mesh.face_to_edges), set(mesh.face_keys))
+        for edge_key, edge_node in mesh.edge_nodes.items():
+            for face_key in (edge_node.face_1_key, edge_node.face_2_key):
+                self.assertIn(face_key, mesh.face_keys)
+                self.assertIn(edge_key, mesh.face_to_edges[face_key])
+
+        # Following a face's boundary only goes through sides of that face.
+        for face_key in mesh.face_keys:
+            for edge_key, vertex_key in operators.face_trace_with_vertices(
+                mesh, face_key
+            ):
+                edge_node = mesh.edge_nodes[edge_key]
+                self.assertEqual(
+                    (
+                        edge_node.face_2_key
+                        if vertex_key == edge_node.vertex_1_key
+                        else edge_node.face_1_key
+                    ),
+                    face_key,
+                )
+
+
+class CornerFromFaceVertexTest(OperatorsTestCase):
+    def test_face_on_the_other_endpoint_side(self):
+        # e1 is v2's first edge, but f1 is on v1's side of it: the corner of f1 at
+        # v2 is formed by e4 instead.
+        mesh = primitives.tetrahedron()
+
+        self.assertEqual(
+            operators.corner_from_face_vertex(mesh, "f1", "v2"),
+            corner.Corner(
+                vertex_key="v2", face_key="f1", edge_1_key="e4", edge_2_key="e1"
+            ),
+        )
+
+    def test_vertex_not_in_face(self):
+        mesh = primitives.tetrahedron()
+
+        with self.assertRaises(ValueError):
+            operators.corner_from_face_vertex(mesh, "f2", "v2")
+
+
+class InsertEdgeTest(OperatorsTestCase):
+    def test_cofacial_splits_face(self):
+        mesh = primitives.square()
+
+        operators.insert_edge(mesh, "v1", "e4", "v3", "e2")
+
+        self.assertConsistent(mesh)
+        edge_node = mesh.edge_nodes["e5"]
+        self.assertNotEqual(edge_node.face_1_key, edge_node.face_2_key)
+
+    def test_after_edges_with_the_same_face_on_both_sides(self):
+        mesh = primitives.tetrahedron()
+
+        operators.insert_edge(mesh, "v2", "e1", "v1", "e1")
+        operators.insert_edge(mesh, "v3", "e6", "v1", "e3")
+        operators.insert_edge(mesh, "v4", "e3", "v1", "e7")
+
+        self.assertConsistent(mesh)
+
+
+class DeleteEdgeTest(OperatorsTestCase):
+    def test_non_cofacial_after_insertion(self):
+        mesh = primitives.tetrahedron()
+        operators.insert_edge(mesh, "v3", "e6", "v1", "e1")
+
+        operators.delete_edge(mesh, "e3")
+        operators.delete_edge(mesh, "e4")
+
+        self.assertNotIn("e3", mesh.edge_nodes)
+        self.assertNotIn("e4", mesh.edge_nodes)
+        self.assertConsistent(mesh)
@@ -0,0 +1,51 @@
+"""Tests for the conversions between OBJ format and DLFL representation."""
+import unittest
+
+from pytopmod.core.dlfl import obj_io, primitives
+
+TRIANGLE_VERTICES = "v 0.0 0.0 0.0\nv 1.0 0.0 0.0\nv 0.0 1.0 0.0\n"
+
+
+class ObjToMeshTest(unittest.TestCase):
+    def test_round_trip(self):
+        obj = obj_io.mesh_to_obj(primitives.tetrahedron())
+
+        mesh = obj_io.obj_to_mesh(obj)
+
+        self.assertEqual(obj_io.mesh_to_obj(mesh), obj)
+        for vertex_key, face_keys in mesh.vertex_faces.items():
+            self.assertEqual(len(face_keys), 3)
+            for face_key in face_keys:
+                self.assertIn(vertex_key, mesh.face_vertices[face_key])
+
+    def test_vertex_texture_normal_elements(self):
+        mesh = obj_io.obj_to_mesh(
+            TRIANGLE_VERTICES + "vt 0 0\nvn 0 0 1\nf 1/1/1 2//1 3/1\nf 3 2 1"
+        )
+
+        self.assertEqual(
+            obj_io.mesh_to_obj(mesh), TRIANGLE_VERTICES + "f 1 2 3\nf 3 2 1"
+        )
+
+    def test_negative_indices(self):
+        mesh = obj_io.obj_to_mesh(TRIANGLE_VERTICES + "f -3 -2 -1\nf -1 -2 -3")
+
+        self.assertEqual(
+            obj_io.mesh_to_obj(mesh), TRIANGLE_VERTICES + "f 1 2 3\nf 3 2 1"
+        )
+
+    def test_zero_index(self):
+        with self.assertRaises(ValueError):
+            obj_io.obj_to_mesh(TRIANGLE_VERTICES + "f 0 1 2")
+
+    def test_out_of_range_negative_index(self):
+        with self.assertRaises(ValueError):
+            obj_io.obj_to_mesh(TRIANGLE_VERTICES + "f -5 1 2")
+
+    def test_index_past_vertices_read_so_far(self):
+        with self.assertRaises(ValueError):
+            obj_io.obj_to_mesh("v 0 0 0\nv 1 0 0\nf 1 2 3\nv 0 1 0\n")
+
+    def test_missing_vertex_coordinates(self):
+        with self.assertRaises(ValueError):
+            obj_io.obj_to_mesh("v 0.0 0.0\nv 1.0 0.0 0.0\nv 0.0 1.0 0.0\nf 1 2 3")
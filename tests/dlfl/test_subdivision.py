@@ -0,0 +1,32 @@
+"""Tests for the subdivision operations on DLFL Meshes."""
+import unittest
+
+from pytopmod.core.dlfl import obj_io, primitives
+from pytopmod.core.dlfl.operations import subdivision
+
+
+class SubdivideEdgeTest(unittest.TestCase):
+    def test_either_face_order(self):
+        # In the tetrahedron, the edge goes from v1 to v2 in f2, and from v2 to v1
+        # in f1.
+        mesh = primitives.tetrahedron()
+        swapped_mesh = primitives.tetrahedron()
+
+        result = subdivision.subdivide_edge(mesh, "v1", "f2", "v2", "f1")
+        swapped_result = subdivision.subdivide_edge(
+            swapped_mesh, "v1", "f1", "v2", "f2"
+        )
+
+        self.assertEqual(result, ("v5", ("f2", "f1")))
+        self.assertEqual(swapped_result, ("v5", ("f1", "f2")))
+        self.assertEqual(mesh.face_vertices["f1"], ["v2", "v5", "v1", "v3"])
+        self.assertEqual(mesh.face_vertices["f2"], ["v1", "v5", "v2", "v4"])
+        self.assertEqual(obj_io.mesh_to_obj(swapped_mesh), obj_io.mesh_to_obj(mesh))
+        self.assertEqual(list(mesh.vertex_faces["v5"]), ["f2", "f1"])
+
+    def test_not_an_edge_between_faces(self):
+        mesh = primitives.tetrahedron()
+
+        with self.assertRaises(ValueError):
+            subdivision.subdivide_edge(mesh, "v1", "f1", "v2", "f3")
+        self.assertEqual(len(mesh.vertex_keys), 4)